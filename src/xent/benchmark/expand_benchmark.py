@@ -1,6 +1,8 @@
 import ast
+import functools
 import io
 import tokenize
+from collections.abc import Callable
 
 from xent.common.configuration_types import (
     CondensedXentBenchmarkConfig,
@@ -205,24 +207,33 @@ class StoryRewriter(ast.NodeTransformer):
         ast.copy_location(new_node, node)
         return new_node
 
+    def _materialize_story_call(self, node: ast.Call) -> ast.AST:
+        new_node = ast.Constant(value=self.judge.generate_text())
+        ast.copy_location(new_node, node)
+        return new_node
+
     def visit_Call(self, node):
         self.generic_visit(node)
-        if isinstance(node.func, ast.Name) and node.func.id == "story":
-            new_node = ast.Constant(value=self.judge.generate_text())
-            ast.copy_location(new_node, node)
-            return new_node
-        if isinstance(node.func, ast.Name) and node.func.id == "generate_list":
-            return self._materialize_generate_list_call(node)
-        if (
-            isinstance(node.func, ast.Name)
-            and node.func.id == "generate_list_next_token"
-        ):
-            return self._materialize_generate_list_next_token_call(node)
-        if isinstance(node.func, ast.Name) and node.func.id == "generate_masked":
-            return self._materialize_generate_masked_call(node)
+        if isinstance(node.func, ast.Name):
+            materialize = _GENERATOR_MATERIALIZERS.get(node.func.id)
+            if materialize is not None:
+                return materialize(self, node)
         return node
 
 
+# Calls that StoryRewriter replaces with freshly generated text. This is the only
+# list of generators; rewrite_static_line relies on it to spot lines needing the judge.
+_GENERATOR_MATERIALIZERS: dict[str, Callable[[StoryRewriter, ast.Call], ast.AST]] = {
+    "story": StoryRewriter._materialize_story_call,
+    "generate_list": StoryRewriter._materialize_generate_list_call,
+    "generate_list_next_token": (
+        StoryRewriter._materialize_generate_list_next_token_call
+    ),
+    "generate_masked": StoryRewriter._materialize_generate_masked_call,
+}
+GENERATOR_FUNCTIONS = frozenset(_GENERATOR_MATERIALIZERS)
+
+
 def extract_comment_and_code(line: str) -> tuple[str, str]:
     """Extract code and comment parts from a line.
     Returns (code_part, comment_part)
@@ -241,9 +252,25 @@ def extract_comment_and_code(line: str) -> tuple[str, str]:
     return line, ""
 
 
+# Lines without generator calls rewrite to the same code for every map, so their
+# normalized form is computed once. Returns None for lines that need the judge.
+@functools.lru_cache(maxsize=1024)
+def rewrite_static_line(code: str) -> str | None:
+    tree = ast.parse(code)
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in GENERATOR_FUNCTIONS
+        ):
+            return None
+    return ast.unparse(tree)
+
+
 def preprocess_dsl_code(code: str, judge: Judge) -> str:
     lines = code.splitlines()
     new_lines: list[str] = []
+    rewriter = StoryRewriter(judge)
 
     for line in lines:
         stripped_line = line.strip()
@@ -271,11 +298,12 @@ def preprocess_dsl_code(code: str, judge: Judge) -> str:
             # Get the indentation from the original line
             original_indent = len(line) - len(line.lstrip())
 
-            tree = ast.parse(code_part.strip())
-            rewriter = StoryRewriter(judge)
-            new_tree = rewriter.visit(tree)
-            ast.fix_missing_locations(new_tree)
-            rewritten_code = ast.unparse(new_tree)
+            rewritten_code = rewrite_static_line(code_part.strip())
+            if rewritten_code is None:
+                tree = ast.parse(code_part.strip())
+                new_tree = rewriter.visit(tree)
+                ast.fix_missing_locations(new_tree)
+                rewritten_code = ast.unparse(new_tree)
 
             # Reconstruct the line with original indentation
             if comment_part:
@@ -2,7 +2,12 @@ import logging
 from typing import Any
 
 from xent.common.configuration_types import ExecutableGameMap
-from xent.runtime.execution import Results, State, run_haltable_game
+from xent.runtime.execution import (
+    Results,
+    State,
+    run_haltable_game,
+    split_game_lines,
+)
 from xent.runtime.judge import Judge
 from xent.runtime.players.players import make_npcs, make_player
 from xent.runtime.runtime import XentRuntime
@@ -37,7 +42,7 @@ async def start_haltable_game(
             "store_full_player_interactions", False
         ),
     )
-    lines = [line.strip() for line in game_code.split("\n")]
+    lines = split_game_lines(game_code)
 
     logging.info(f"Running game: {game_str}")
     game_results = await run_haltable_game(
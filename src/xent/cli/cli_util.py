@@ -1,9 +1,6 @@
+import secrets
 from datetime import datetime
 
 
 def generate_benchmark_id():
-    return (
-        datetime.now().strftime("%Y-%m-%d-%H:%M:%S")
-        + "-"
-        + hex(hash(str(datetime.now().timestamp())))[-6:]
-    )
+    return f"{datetime.now():%Y-%m-%d-%H:%M:%S}-{secrets.token_hex(3)}"
@@ -36,11 +36,21 @@ def x_decoder(dct):
     return dct
 
 
+# json.dumps/json.loads build a new encoder/decoder on every call when given a custom
+# cls or object_hook, so the common no-option case reuses shared instances
+_X_ENCODER = XEncoder()
+_X_DECODER = json.JSONDecoder(object_hook=x_decoder)
+
+
 def dumps(obj, **kwargs):
+    if not kwargs:
+        return _X_ENCODER.encode(obj)
     return json.dumps(obj, cls=XEncoder, **kwargs)
 
 
 def loads(s, **kwargs):
+    if not kwargs and isinstance(s, str):
+        return _X_DECODER.decode(s)
     return json.loads(s, object_hook=x_decoder, **kwargs)
 
 
@@ -1,5 +1,7 @@
+import functools
 import logging
 from collections.abc import Callable, Mapping
+from types import CodeType
 from typing import Any
 
 from xent.common.configuration_types import XentEvent, XentMetadata
@@ -69,10 +71,18 @@ SAMPLE_METADATA: XentMetadata = XentMetadata(
 )
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_presentation() -> str:
     return DEFAULT_PRESENTATION.strip()
 
 
+# Every player of a game loads the same presentation source, so compilation is
+# cached per source. Each PresentationFunction still execs into its own namespace.
+@functools.lru_cache(maxsize=128)
+def _compile_presentation(code_string: str) -> CodeType:
+    return compile(code_string, "<presentation_turn>", "exec")
+
+
 class PresentationFunction:
     """
     Loader/executor for presentation functions that implement:
@@ -101,7 +111,7 @@ class PresentationFunction:
         ) = None
 
         try:
-            self.compiled_code = compile(code_string, "<presentation_turn>", "exec")
+            self.compiled_code = _compile_presentation(code_string)
         except SyntaxError as e:
             raise XentInternalError(
                 f"Turn presentation function syntax error: {e}"
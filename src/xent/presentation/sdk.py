@@ -1,7 +1,9 @@
+from collections import Counter
 from collections.abc import Callable
 from typing import Any
 
 from xent.common.token_xent_list import TokenXentList
+from xent.common.x_string import XString
 from xent.common.xent_event import (
     ElicitRequestEvent,
     ElicitResponseEvent,
@@ -120,11 +122,7 @@ def count_event(events: list[XentEvent], event_type: str) -> int:
 
 
 def count_all_events(events: list[XentEvent]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for event in events:
-        event_type_str: str = event["type"]
-        counts[event_type_str] = counts.get(event_type_str, 0) + 1
-    return counts
+    return dict(Counter(event["type"] for event in events))
 
 
 def format_token_xent_list(txl: TokenXentList, scaled: bool = True) -> str:
@@ -307,13 +305,12 @@ def get_event_summary(history: list[XentEvent]) -> str:
 
 
 def get_current_registers(state: dict[str, Any]) -> dict[str, str]:
-    registers = {}
-    for name, value in state.items():
-        if hasattr(value, "primary_string"):  # XString objects
-            registers[name] = str(value.primary_string)
-        elif isinstance(value, str | int | float | bool):
-            registers[name] = str(value)
-    return registers
+    # str() of an XString is its primary string
+    return {
+        name: str(value)
+        for name, value in state.items()
+        if isinstance(value, XString | str | int | float | bool)
+    }
 
 
 def format_registers_display(registers: dict[str, str]) -> str:
@@ -1,5 +1,8 @@
 import ast
+import copy
+import functools
 import logging
+from types import CodeType
 from typing import Any, Literal, TypedDict
 
 from xent.common.configuration_types import GameMapRoundResult
@@ -52,13 +55,25 @@ class ListLiteralToXListTransformer(ast.NodeTransformer):
         )
 
 
+# Blank lines are kept so that line indices match the source game code. Only the
+# split is memoized per code string; split_game_lines still returns a fresh list
+# because the game runners take and serialize list[str].
+@functools.lru_cache(maxsize=128)
+def _split_game_lines(code: str) -> tuple[str, ...]:
+    return tuple(line.strip() for line in code.split("\n"))
+
+
+def split_game_lines(code: str) -> list[str]:
+    return list(_split_game_lines(code))
+
+
 async def play_game(
     code: str,
     xrt: XentRuntime,
     num_rounds: int = 30,
     always_return_results: bool = False,  # Used for interactive play that may break at any moment
 ) -> list[GameMapRoundResult]:
-    lines = [line.strip() for line in code.split("\n")]
+    lines = split_game_lines(code)
     if len(lines) > 64:
         raise XentConfigurationError("Code too long. Max 64 lines.")
 
@@ -215,10 +230,11 @@ async def play_single_game(
 
 async def eval_line(line: str, line_num: int, xrt: XentRuntime) -> XFlag | None:
     # Inline comments are handled by ast, but if the line starts with # or is empty, we ignore it
-    if (line.strip() == "") or line.strip().startswith("#"):
+    stripped_line = line.strip()
+    if (stripped_line == "") or stripped_line.startswith("#"):
         return None
     try:
-        tree = ast.parse(line, mode="eval")
+        tree = parse_line(line)
     except SyntaxError as e:
         logging.exception(f"Syntax error in expression: {e}")
         raise XentSyntaxError(
@@ -263,8 +279,29 @@ async def eval_line(line: str, line_num: int, xrt: XentRuntime) -> XFlag | None:
     return result
 
 
+# Game lines are re-evaluated every round, so parsing is cached per source line.
+# The returned tree is shared between calls and must not be mutated.
+@functools.lru_cache(maxsize=4096)
+def parse_line(line: str) -> ast.Expression:
+    return ast.parse(line, mode="eval")
+
+
+# Keyed on node identity, which is stable for nodes of trees cached by parse_line
+@functools.lru_cache(maxsize=4096)
+def compile_arg(arg_node: ast.expr) -> CodeType:
+    arg_node = copy.deepcopy(arg_node)
+    arg_node = StringLiteralToXStringTransformer().visit(arg_node)
+    arg_node = ListLiteralToXListTransformer().visit(arg_node)
+
+    ast.fix_missing_locations(arg_node)
+    return compile(ast.Expression(body=arg_node), filename="<ast>", mode="eval")
+
+
 def get_validated_call_info(
-    tree: ast.Expression, instruction_names: set[str], line: str, line_num: int
+    tree: ast.Expression,
+    instruction_names: frozenset[str],
+    line: str,
+    line_num: int,
 ) -> tuple[str, ast.Call]:
     if not isinstance(tree.body, ast.Call):
         raise XentSyntaxError(
@@ -316,11 +353,7 @@ def gather_params(
 
 def resolve_arg(arg_node: ast.expr, xrt: XentRuntime, line: str, line_num: int) -> Any:
     try:
-        arg_node = StringLiteralToXStringTransformer().visit(arg_node)
-        arg_node = ListLiteralToXListTransformer().visit(arg_node)
-
-        ast.fix_missing_locations(arg_node)
-        code = compile(ast.Expression(body=arg_node), filename="<ast>", mode="eval")
+        code = compile_arg(arg_node)
         resolved_arg = eval(code, xrt.globals, xrt.local_vars)
         return resolved_arg
     except Exception as e:
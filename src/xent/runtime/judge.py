@@ -1,8 +1,10 @@
+import functools
 import hashlib
 import logging
 import math
 import os
 import random
+from collections.abc import Sequence
 from typing import Any, Self
 
 import numpy as np
@@ -70,6 +72,10 @@ class Judge:
                 model_name, **model_kwargs
             )
         self.rng = random.Random()
+        # Game lines are evaluated every round, so the same strings are tokenized
+        # repeatedly. Cached tensors are shared and must not be modified in place.
+        self._tokenize_cached = functools.lru_cache(maxsize=4096)(self._tokenize)
+        self._decode_token = functools.lru_cache(maxsize=65536)(self._decode_token_id)
 
         self.tokenizer.pad_token = self.tokenizer.eos_token
         bos_token_id = self.tokenizer.bos_token_id
@@ -123,12 +129,16 @@ class Judge:
         )
 
     def tokenize(self, string: str | XString) -> torch.Tensor:
-        if isinstance(string, XString):
-            string = str(string)
+        return self._tokenize_cached(str(string))
+
+    def _tokenize(self, string: str) -> torch.Tensor:
         return self.tokenizer(string, return_tensors="pt").input_ids.to(
             self.model.device  # type: ignore[attr-defined]
         )
 
+    def _decode_token_id(self, token_id: int) -> str:
+        return self.tokenizer.decode([token_id])  # pyright: ignore[reportReturnType]
+
     def num_tokens(self, string: str | XString) -> int:
         return self.tokenize(string).shape[-1]
 
@@ -151,22 +161,21 @@ class Judge:
     def detokenize(self, tokens: torch.Tensor) -> str:
         return self.tokenizer.decode(tokens.cpu().view(-1))  # pyright: ignore[reportReturnType]
 
-    def comp_logits(self, tokens: torch.Tensor) -> torch.Tensor:
+    def comp_logits(
+        self, tokens: torch.Tensor, attention_mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
         with torch.inference_mode():
-            result = self.model(tokens, return_dict=True)  # type: ignore[operator]
-            return result.logits
-
-    def xent(
-        self,
-        string: XString,
-        preprompt: str | XString = "",
-        include_first_token: bool = False,
-    ) -> TokenXentList:
-        raw_string: str = str(string)
-        prefix: str = str(str(preprompt) + string.prefix)
-        if len(raw_string) == 0:
-            return TokenXentList([])
-
+            result = self.model(  # type: ignore[operator]
+                tokens, attention_mask=attention_mask, return_dict=True
+            )
+            # Models loaded in half precision still get float32 log-probs
+            return result.logits.float()
+
+    # Returns the flat token sequence fed to the model and the index of the first
+    # token that is scored
+    def _xent_tokens(
+        self, raw_string: str, prefix: str, include_first_token: bool
+    ) -> tuple[torch.Tensor, int]:
         tokenized_prefix: torch.Tensor = self.tokenize(prefix).to(torch.int64)
         tokenized_string: torch.Tensor = self.tokenize(raw_string).to(torch.int64)
         prefix_length: int = tokenized_prefix.shape[-1]
@@ -179,43 +188,93 @@ class Judge:
             tokens: torch.Tensor = torch.cat(
                 [bos, tokenized_prefix, tokenized_string], dim=-1
             )
-            logits: torch.Tensor = self.comp_logits(tokens).view(tokens.shape[-1], -1)
-            tokens = tokens.view(-1)
-
-            pre_len: int = 1 + prefix_length  # BOS + prefix
-            target_tokens: torch.Tensor = tokens[pre_len:]
-            xent_values: torch.Tensor = F.cross_entropy(
-                logits[pre_len - 1 : -1, :], target_tokens, reduction="none"
-            )
-        else:
-            tokens: torch.Tensor = torch.cat(
-                [tokenized_prefix, tokenized_string], dim=-1
-            )
-            logits: torch.Tensor = self.comp_logits(tokens).view(tokens.shape[-1], -1)
-            tokens = tokens.view(-1)
+            return tokens.view(-1), 1 + prefix_length  # BOS + prefix
+        tokens = torch.cat([tokenized_prefix, tokenized_string], dim=-1)
+        return tokens.view(-1), prefix_length + 1
 
-            target_tokens: torch.Tensor = tokens[prefix_length + 1 :]
-            xent_values: torch.Tensor = F.cross_entropy(
-                logits[prefix_length:-1, :], target_tokens, reduction="none"
-            )
+    def _token_xent_list(
+        self, tokens: torch.Tensor, logits: torch.Tensor, start: int
+    ) -> TokenXentList:
+        target_tokens: torch.Tensor = tokens[start:]
+        xent_values: torch.Tensor = F.cross_entropy(
+            logits[start - 1 : tokens.shape[-1] - 1, :], target_tokens, reduction="none"
+        )
         if self.max_token_xent_nats is not None:
             xent_values = torch.clamp(xent_values, max=self.max_token_xent_nats)
         # Convert to bits
         xent_bits = xent_values / math.log(2)
 
-        token_strings: list[str] = []
-        for i in range(len(target_tokens)):
-            single_token_tensor: torch.Tensor = target_tokens[i : i + 1].unsqueeze(0)
-            token_str: str = self.detokenize(single_token_tensor)
-            token_strings.append(token_str)
+        token_strings: list[str] = [
+            self._decode_token(token_id) for token_id in target_tokens.tolist()
+        ]
 
         paired_results: list[tuple[str, float]] = list(
             zip(token_strings, xent_bits.tolist(), strict=False)
         )
-        txl: TokenXentList = TokenXentList(paired_results)
+        return TokenXentList(paired_results)
+
+    def xent(
+        self,
+        string: XString,
+        preprompt: str | XString = "",
+        include_first_token: bool = False,
+    ) -> TokenXentList:
+        raw_string: str = str(string)
+        prefix: str = str(str(preprompt) + string.prefix)
+        if len(raw_string) == 0:
+            return TokenXentList([])
+
+        tokens, start = self._xent_tokens(raw_string, prefix, include_first_token)
+        logits: torch.Tensor = self.comp_logits(tokens.unsqueeze(0))[0]
+        txl: TokenXentList = self._token_xent_list(tokens, logits, start)
         logging.info(f"Xent for {string} with prefix {prefix}: {txl.total_xent()}")
         return txl
 
+    # Same results as calling xent() on each string, but with one padded forward pass.
+    # Library API: the DSL runtime still scores one string per xent() call.
+    def xent_batch(
+        self,
+        strings: list[XString],
+        preprompts: Sequence[str | XString] | None = None,
+        include_first_token: bool = False,
+    ) -> list[TokenXentList]:
+        prompts: Sequence[str | XString] = (
+            [""] * len(strings) if preprompts is None else preprompts
+        )
+        if len(prompts) != len(strings):
+            raise ValueError("xent_batch needs one preprompt per string")
+
+        results: list[TokenXentList] = [TokenXentList([]) for _ in strings]
+        rows: list[tuple[int, torch.Tensor, int]] = []
+        for i, (string, preprompt) in enumerate(zip(strings, prompts, strict=True)):
+            raw_string: str = str(string)
+            if len(raw_string) == 0:
+                continue
+            prefix: str = str(str(preprompt) + string.prefix)
+            tokens, start = self._xent_tokens(raw_string, prefix, include_first_token)
+            rows.append((i, tokens, start))
+        if not rows:
+            return results
+
+        # Right padding keeps the positions of real tokens unchanged
+        max_length: int = max(tokens.shape[-1] for _, tokens, _ in rows)
+        device = rows[0][1].device
+        input_ids: torch.Tensor = torch.full(
+            (len(rows), max_length),
+            self.tokenizer.pad_token_id,  # type: ignore[arg-type]
+            dtype=torch.int64,
+            device=device,
+        )
+        attention_mask: torch.Tensor = torch.zeros_like(input_ids)
+        for row, (_, tokens, _) in enumerate(rows):
+            input_ids[row, : tokens.shape[-1]] = tokens
+            attention_mask[row, : tokens.shape[-1]] = 1
+
+        logits: torch.Tensor = self.comp_logits(input_ids, attention_mask)
+        for row, (i, tokens, start) in enumerate(rows):
+            results[i] = self._token_xent_list(tokens, logits[row], start)
+        return results
+
     def xed(
         self,
         string: XString,
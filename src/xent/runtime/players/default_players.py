@@ -34,6 +34,8 @@ class MockXGP(XGP):
     ):
         super().__init__(name, id, options, executable_game_map)
         self.event_history: list[XentEvent] = []
+        # Index of event_history by event type, kept in sync by post()
+        self.events_by_type: dict[str, list[XentEvent]] = {}
         self.token_usage_per_move = token_usage_per_move or {
             "input_tokens": 1,
             "output_tokens": 1,
@@ -65,6 +67,8 @@ class MockXGP(XGP):
             data["token_usage_per_move"],
         )
         mock_xgp.event_history = [deserialize_event(e) for e in data["event_history"]]
+        for event in mock_xgp.event_history:
+            mock_xgp.events_by_type.setdefault(event["type"], []).append(event)
         mock_xgp.presentation_ctx = data["presentation_ctx"]
         mock_xgp.conversation = data["conversation"]
         return mock_xgp
@@ -114,6 +118,10 @@ class MockXGP(XGP):
     async def post(self, event: XentEvent) -> None:
         logging.info(f"Player received: {event}")
         self.event_history.append(event)
+        self.events_by_type.setdefault(event["type"], []).append(event)
+
+    def last_event(self, event_type: str) -> XentEvent:
+        return self.events_by_type[event_type][-1]
 
 
 class DefaultXGP(XGP):
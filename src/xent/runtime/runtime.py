@@ -32,6 +32,10 @@ ENFORCE_XENT_ENSURE = False
 
 MAX_ENSURE_FAILURES = 10
 
+INSTRUCTION_NAMES = frozenset(
+    ["assign", "elicit", "reveal", "reward", "ensure", "beacon", "replay"]
+)
+
 
 class XentRuntime:
     def __init__(
@@ -155,8 +159,8 @@ class XentRuntime:
         self.token_usage["input_tokens"] += token_usage["input_tokens"]
         self.token_usage["output_tokens"] += token_usage["output_tokens"]
 
-    def instruction_names(self) -> set[str]:
-        return {"assign", "elicit", "reveal", "reward", "ensure", "beacon", "replay"}
+    def instruction_names(self) -> frozenset[str]:
+        return INSTRUCTION_NAMES
 
     def _reset_register_states(self):
         for var_name, var in self.local_vars.items():
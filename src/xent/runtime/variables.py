@@ -1,6 +1,7 @@
 import random
 import re
 import string
+import sys
 from collections.abc import Callable, Iterable
 from typing import Any
 
@@ -27,7 +28,9 @@ def build_locals(player: XGP, npcs: list[XGP], game_config: ExecutableGameMap):
 
     for i in range(NUM_VARIABLES_PER_REGISTER):
         for t in ALL_REGISTERS:
-            var_name = t if i == 0 else f"{t}{i}"
+            # Interned so that lookups by identifiers from compiled DSL code hit
+            # the dict's identity fast path
+            var_name = sys.intern(t if i == 0 else f"{t}{i}")
             if t in LIST_REGISTERS:
                 local_vars[var_name] = XList(
                     [],
@@ -1,22 +1,56 @@
+import contextlib
+import functools
+import hashlib
+import logging
 import os
+from dataclasses import dataclass
+from pathlib import Path
 
+import matplotlib
 import pytest
+import torch
+from ollama import AsyncClient
+from pytest_asyncio import is_async_test
 from transformers import AutoModelForCausalLM, AutoTokenizer
+from typeguard import check_type
 
-from xent.common.configuration_types import ExecutableGameMap
+import xent
+from tests._prompts import BOOK_CLUB, COW_PHYSICS
+from xent.analysis.analyze import analyze
+from xent.benchmark.expand_benchmark import expand_benchmark_config
+from xent.benchmark.run_benchmark import run_benchmark
+from xent.cli.cli_util import generate_benchmark_id
+from xent.cli.configure import DEFAULT_EXPANSION_CONFIG
+from xent.cli.run import DEFAULT_XENT_METADATA
+from xent.common.configuration_types import (
+    CondensedXentBenchmarkConfig,
+    ExecutableGameMap,
+    ExpandedXentBenchmarkConfig,
+    ExpansionConfig,
+    GameConfig,
+    PlayerConfig,
+    XentMetadata,
+)
+from xent.common.util import dumps
 from xent.common.version import get_xent_version
 from xent.presentation.executor import get_default_presentation
 from xent.runtime.judge import Judge
 from xent.runtime.players.default_players import MockXGP
 from xent.runtime.runtime import XentRuntime
 from xent.runtime.variables import build_globals, build_locals
+from xent.storage.directory_storage import DirectoryBenchmarkStorage
+
+_DEFAULT_PRESENTATION = get_default_presentation()
+
+# Ollama model played by --real-llm integration runs
+_OLLAMA_TEST_MODEL = "qwen3:0.6b"
 
 FAKE_GAME_MAP: ExecutableGameMap = {
     "game_map": {
         "name": "Fake Game",
         "code": "fake_code",
         "map_seed": "test_seed_0",
-        "presentation_function": get_default_presentation(),
+        "presentation_function": _DEFAULT_PRESENTATION,
     },
     "metadata": {
         "benchmark_id": "",
@@ -44,10 +78,38 @@ def pytest_addoption(parser):
         default=False,
         help="Skip pre-caching of ML models before tests run",
     )
+    parser.addoption(
+        "--skip-type-checks",
+        action="store_true",
+        default=False,
+        help="Skip typeguard validation of expanded benchmark configs",
+    )
+    parser.addoption(
+        "--benchmark-cache-dir",
+        default=None,
+        help=(
+            "Keep shared integration benchmark results in this directory and reuse "
+            "stored game results on later runs with an identical config and "
+            "identical src/xent sources; any source edit starts a fresh run"
+        ),
+    )
+    parser.addoption(
+        "--real-llm",
+        action="store_true",
+        default=False,
+        help=f"Play integration benchmarks with Ollama {_OLLAMA_TEST_MODEL} instead of "
+        "the mock player",
+    )
 
 
 def pytest_configure(config):
     """Pre-cache models before tests run, then enable offline mode"""
+    # Render analysis plots headlessly instead of probing for a GUI backend
+    matplotlib.use("Agg")
+
+    if hasattr(config, "workerinput"):
+        # xdist workers inherit the offline environment from the controller
+        return
     if config.getoption("--skip-model-cache"):
         print("⏭️  Skipping model pre-caching (--skip-model-cache enabled)")
         return
@@ -86,6 +148,14 @@ def pytest_configure(config):
         print("⚠️  No models were cached - tests will run with network access")
 
 
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-scoped event loop"""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
 def pytest_unconfigure(config):
     """Clean up after tests"""
     env_vars_to_clean = [
@@ -104,12 +174,241 @@ def pytest_unconfigure(config):
         print(f"🔓 Disabled offline mode ({', '.join(cleaned)})")
 
 
+@functools.lru_cache(maxsize=4)
+def _judge_for(model_name: str) -> Judge:
+    # Tests only compare scores against each other, so bf16 weights are fine on GPU
+    model_params = {"dtype": torch.bfloat16} if torch.cuda.is_available() else None
+    return Judge(model_name, model_params=model_params)
+
+
+@pytest.fixture(scope="session")
+def judge_for():
+    """Return a factory that loads each judge model at most once per session."""
+    return _judge_for
+
+
+@pytest.fixture(scope="session")
+def gpt2_judge(judge_for):
+    """Load the gpt2 judge once and share it across the test session."""
+    return judge_for("gpt2")
+
+
 @pytest.fixture
-def xrt():
-    """Create a test XentRuntime instance."""
+def xrt(gpt2_judge):
+    """Create a test XentRuntime instance.
+
+    The runtime itself is rebuilt for every test so that register, player and flag
+    state never leaks between tests; only the judge model is shared.
+    """
     executable_game_map = FAKE_GAME_MAP.copy()
     player = MockXGP("black", "mock_black_id", {}, executable_game_map)
     locals = build_locals(player, [], executable_game_map)
-    judge = Judge("gpt2")
-    globals = build_globals(judge)
+    globals = build_globals(gpt2_judge)
     return XentRuntime(player, [], locals, globals)
+
+
+@dataclass
+class ScoreDelta:
+    value: float = 0.0
+
+
+@pytest.fixture
+def score_delta(xrt):
+    """Measure how much a player's score changes inside an ``async with`` block."""
+
+    @contextlib.asynccontextmanager
+    async def _score_delta(player_name: str):
+        player = xrt.local_vars[player_name]
+        start = player.get_score()
+        delta = ScoreDelta()
+        yield delta
+        delta.value = player.get_score() - start
+
+    return _score_delta
+
+
+@pytest.fixture(scope="session")
+def benchmark_results_dir(tmp_path_factory):
+    """Session-scoped temporary directory for shared benchmark results"""
+    test_dir = tmp_path_factory.mktemp("benchmark_results")
+    yield test_dir
+
+
+# (name, code) for each game in the shared integration benchmark
+_BENCHMARK_GAMES: tuple[tuple[str, str], ...] = (
+    # Game 1: Simple single player test
+    (
+        "test_single",
+        f"""
+            assign(s1="{BOOK_CLUB}", s2="{COW_PHYSICS}")
+            reveal(s1, s2)
+            elicit(x, 20)
+            reward(xent(x | s1))
+            reward(-xent(s2 | (s1+x)))
+        """,
+    ),
+    # Game 2: Multi-step test
+    (
+        "test_multi",
+        f"""
+            assign(t1="{BOOK_CLUB}", t2="{COW_PHYSICS}")
+            reveal(t1)
+            elicit(y, 15)
+            reward(xent(y | t1))
+            reveal(t2)
+            reward(-xent(t2 | y))
+        """,
+    ),
+    (
+        "test_lists",
+        """
+            assign(l=["a bunch of", "different words", "for testing purposes", "that are", "unlikey to shuffle", "in the same", "order"])
+            reveal(l)
+            elicit(s, 10)
+            assign(t=sample(l))
+            assign(l2=shuffle(l))
+            reveal(l2)
+            reveal(t)
+            reward(xent(t | s))
+        """,
+    ),
+)
+
+
+def create_test_benchmark_config(player: PlayerConfig) -> CondensedXentBenchmarkConfig:
+    """Create a comprehensive benchmark config for testing all scenarios"""
+    id_string = generate_benchmark_id()
+    return CondensedXentBenchmarkConfig(
+        config_type="condensed_xent_config",
+        metadata=XentMetadata(
+            benchmark_id=id_string,
+            xent_version=DEFAULT_XENT_METADATA["xent_version"],
+            num_rounds_per_game=1,
+            judge_model=DEFAULT_XENT_METADATA["judge_model"],
+            seed=DEFAULT_XENT_METADATA["seed"],
+            store_full_player_interactions=False,
+            npcs=[],
+        ),
+        expansion_config=ExpansionConfig(
+            num_maps_per_game=DEFAULT_EXPANSION_CONFIG["num_maps_per_game"],
+            text_generation_config={
+                "generator_type": "JUDGE",
+                "generator_config": {},
+                "max_length": 50,
+            },
+        ),
+        games=[
+            GameConfig(
+                name=name, code=code, presentation_function=_DEFAULT_PRESENTATION
+            )
+            for name, code in _BENCHMARK_GAMES
+        ],
+        players=[player],
+    )
+
+
+@pytest.fixture(scope="session")
+def check_expanded_config(request):
+    """Validate an expanded config against its TypedDict unless disabled"""
+    if request.config.getoption("--skip-type-checks"):
+        return lambda expanded_config: None
+    return lambda expanded_config: check_type(
+        expanded_config, ExpandedXentBenchmarkConfig
+    )
+
+
+@pytest.fixture(scope="session")
+def real_llm(request) -> bool:
+    return request.config.getoption("--real-llm")
+
+
+@pytest.fixture(scope="session")
+def integration_player(real_llm) -> PlayerConfig:
+    """Player for integration benchmarks; only --real-llm needs a running Ollama"""
+    if real_llm:
+        return PlayerConfig(
+            name="black",
+            id=_OLLAMA_TEST_MODEL,
+            player_type="default",
+            options={"provider": "ollama", "model": _OLLAMA_TEST_MODEL},
+        )
+    return PlayerConfig(name="black", id="mock", player_type="mock", options={})
+
+
+@pytest.fixture(scope="session")
+async def warm_ollama_model(real_llm):
+    """Load the integration player's model into Ollama once per session"""
+    if not real_llm:
+        return
+    ollama_host = os.environ.get("OLLAMA_HOST")
+    client = AsyncClient(ollama_host) if ollama_host else AsyncClient()
+    try:
+        # An empty prompt only loads the model; keep it resident for the session
+        await client.generate(model=_OLLAMA_TEST_MODEL, prompt="", keep_alive="30m")
+    except Exception as e:
+        # The tests using the model will report the underlying problem
+        logging.warning(f"Could not warm up Ollama model: {e}")
+
+
+def _benchmark_cache_id(config: CondensedXentBenchmarkConfig) -> str:
+    """Benchmark id derived from the xent sources and the config except its id"""
+    metadata = {**config["metadata"], "benchmark_id": ""}
+    canonical = dumps({**config, "metadata": metadata}, sort_keys=True)
+    digest = hashlib.sha256(canonical.encode())
+    # Any edit to the runtime, expansion or judge code must invalidate stored results,
+    # committed or not, so hash the package sources rather than the version string
+    package_dir = Path(xent.__file__).parent
+    for source in sorted(package_dir.rglob("*.py")):
+        digest.update(source.relative_to(package_dir).as_posix().encode())
+        digest.update(source.read_bytes())
+    return "integration-" + digest.hexdigest()[:16]
+
+
+@pytest.fixture(scope="session")
+async def shared_benchmark_results(
+    request,
+    benchmark_results_dir,
+    integration_player,
+    warm_ollama_model,
+    check_expanded_config,
+):
+    """Run benchmark once and share results across all integration tests"""
+
+    benchmark_config = create_test_benchmark_config(integration_player)
+    storage_dir = benchmark_results_dir
+    cache_dir = request.config.getoption("--benchmark-cache-dir")
+    if cache_dir is not None:
+        # run_benchmark skips game maps whose results are already in storage, so a
+        # stable id lets later sessions pick up the stored results
+        benchmark_config["metadata"]["benchmark_id"] = _benchmark_cache_id(
+            benchmark_config
+        )
+        storage_dir = Path(cache_dir)
+    logging.info(f"Running shared benchmark with config: {benchmark_config}")
+
+    expanded_config = expand_benchmark_config(benchmark_config)
+    check_expanded_config(expanded_config)
+    # Run the benchmark once on the session event loop
+    storage = DirectoryBenchmarkStorage(
+        storage_dir, benchmark_config["metadata"]["benchmark_id"]
+    )
+    await storage.initialize()
+    await storage.store_config(expanded_config)
+    # One slot per game; results come back in config order regardless
+    benchmark_results = await run_benchmark(
+        expanded_config, storage, len(expanded_config["games"])
+    )
+
+    return {
+        "config": expanded_config,
+        "results": benchmark_results,
+        "test_dir": benchmark_results_dir,
+    }
+
+
+@pytest.fixture(scope="session")
+def analyzed_benchmark_dir(shared_benchmark_results):
+    """Run the full analysis pipeline once, only for tests that read its outputs"""
+    test_dir = shared_benchmark_results["test_dir"]
+    analyze(shared_benchmark_results["results"], os.fspath(test_dir), make_pdf=False)
+    return test_dir
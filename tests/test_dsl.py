@@ -121,6 +121,15 @@ class TestAssignInstruction:
         await eval_line("assign(s='second')", 1, xrt)
         assert str(xrt.local_vars["s"]) == "second"
 
+    @pytest.mark.asyncio
+    async def test_assign_repeated_line(self, xrt):
+        """Test that re-evaluating the same (cached) line gives the same result."""
+        for i in range(3):
+            await eval_line("assign(s='hi', l=['a', 'b'])", i, xrt)
+            assert str(xrt.local_vars["s"]) == "hi"
+            assert isinstance(xrt.local_vars["l"], XList)
+            assert [str(item) for item in xrt.local_vars["l"]] == ["a", "b"]
+
     @pytest.mark.asyncio
     async def test_assign_with_positional_args(self, xrt):
         """Test that assign only accepts keyword arguments."""
@@ -166,8 +175,8 @@ class TestAssignInstruction:
         assert len(game_results) == 1
 
         # Check that the assignments worked by looking at the reveal
-        player_history = xrt.player.event_history
-        assert any("hello world" in str(h) for h in player_history)
+        reveal_event = xrt.player.last_event("reveal")
+        assert str(reveal_event["values"]["s3"]) == "hello world"
 
 
 class TestRevealInstruction:
@@ -830,53 +839,49 @@ class TestDSLFunctions:
         assert str(xrt.local_vars["s1"]) == "blue"
 
     @pytest.mark.asyncio
-    async def test_xent_comprehensive(self, xrt):
+    async def test_xent_comprehensive(self, xrt, score_delta):
         """Comprehensive test for xent() function with and without prefix."""
         # Part 1: Test basic xent() function
-        score_before = xrt.local_vars["black"].score
-        await eval_line("reward(black, xent('hello world'))", 1, xrt)
-        first_score = xrt.local_vars["black"].score - score_before
-        await eval_line(
-            "reward(black, xent('hello world hello world hello world'))", 2, xrt
-        )
-        second_score = xrt.local_vars["black"].score - score_before - first_score
-        assert second_score > first_score  # Longer string has higher xent
+        async with score_delta("black") as first:
+            await eval_line("reward(black, xent('hello world'))", 1, xrt)
+        async with score_delta("black") as second:
+            await eval_line(
+                "reward(black, xent('hello world hello world hello world'))", 2, xrt
+            )
+        assert second.value > first.value  # Longer string has higher xent
 
         # Part 2: Test xent() with prefix (| operator)
-        score_with_prefix_before = xrt.local_vars["black"].score
-        await eval_line("reward(black, xent('hello world'))", 3, xrt)
-        score_no_prefix = xrt.local_vars["black"].score - score_with_prefix_before
-        await eval_line(
-            "reward(black, xent('hello world' | 'first program print text'))", 4, xrt
-        )
-        score_with_prefix = (
-            xrt.local_vars["black"].score - score_with_prefix_before - score_no_prefix
-        )
-        assert score_with_prefix < score_no_prefix  # Prefix reduces xent
+        async with score_delta("black") as no_prefix:
+            await eval_line("reward(black, xent('hello world'))", 3, xrt)
+        async with score_delta("black") as with_prefix:
+            await eval_line(
+                "reward(black, xent('hello world' | 'first program print text'))",
+                4,
+                xrt,
+            )
+        assert with_prefix.value < no_prefix.value  # Prefix reduces xent
 
     @pytest.mark.asyncio
-    async def test_nex_function(self, xrt):
+    async def test_nex_function(self, xrt, score_delta):
         """Test basic nex() function."""
-        score_before = xrt.local_vars["black"].score
-        await eval_line("reward(black, nex('hello world'))", 1, xrt)
-        first_score = xrt.local_vars["black"].score - score_before
-        await eval_line(
-            "reward(black, nex('hello world hello world hello world'))", 2, xrt
-        )
-        second_score = xrt.local_vars["black"].score - score_before - first_score
+        async with score_delta("black") as first:
+            await eval_line("reward(black, nex('hello world'))", 1, xrt)
+        async with score_delta("black") as second:
+            await eval_line(
+                "reward(black, nex('hello world hello world hello world'))", 2, xrt
+            )
 
-        assert second_score < first_score
+        assert second.value < first.value
 
     @pytest.mark.asyncio
-    async def test_xed_function(self, xrt):
+    async def test_xed_function(self, xrt, score_delta):
         """Test xed() function."""
-        score_before = xrt.local_vars["black"].score
-        await eval_line(
-            "reward(black, xed('hello world' | 'first program print text'))", 1, xrt
-        )
-        score_after = xrt.local_vars["black"].score - score_before
+        async with score_delta("black") as delta:
+            await eval_line(
+                "reward(black, xed('hello world' | 'first program print text'))", 1, xrt
+            )
         # Test that xed() gives a positive score
-        assert score_after > score_before
+        assert delta.value > 0
 
     @pytest.mark.asyncio
     async def test_function_in_conditionals(self, xrt):
@@ -893,32 +898,50 @@ class TestDSLFunctions:
         assert result is None  # Should pass
 
 
-class TestErrorCases:
-    """Test error handling and invalid usage scenarios."""
+ERROR_CASES = [
+    # Unknown instructions
+    pytest.param("unknown_instruction(x='test')", XentSyntaxError, id="unknown-1"),
+    pytest.param("this_does_not_exist()", XentSyntaxError, id="unknown-2"),
+    # Malformed syntax
+    pytest.param("assign(s='test'", XentSyntaxError, id="missing-paren"),
+    pytest.param("assign(s=test)", XentGameError, id="missing-quotes"),
+    pytest.param("assign s='test'", XentSyntaxError, id="invalid-python"),
+    # Wrong argument kinds
+    pytest.param("assign('s', 'value')", XentSyntaxError, id="assign-positional"),
+    pytest.param("reveal(value='test')", XentSyntaxError, id="reveal-kwargs"),
+    pytest.param("ensure(condition=True)", XentSyntaxError, id="ensure-kwargs"),
+    # Missing required arguments
+    pytest.param("elicit(s)", XentSyntaxError, id="elicit-no-token-limit"),
+    pytest.param("beacon()", XentSyntaxError, id="beacon-no-flag"),
+    pytest.param("replay()", XentSyntaxError, id="replay-no-args"),
+    # Too many arguments
+    pytest.param("beacon(flag_1, flag_2)", XentSyntaxError, id="beacon-two-flags"),
+    # Invalid register names
+    pytest.param("assign(z='invalid')", XentSyntaxError, id="invalid-register-type"),
+    pytest.param("assign(s99='too_high')", XentSyntaxError, id="register-too-high"),
+    pytest.param("assign(1s='invalid')", XentSyntaxError, id="register-bad-format"),
+    # Undefined register access
+    pytest.param("assign(s=undefined_var)", XentGameError, id="assign-undefined-var"),
+    pytest.param("reveal(undefined_var)", XentGameError, id="reveal-undefined-var"),
+    # Undefined functions
+    pytest.param(
+        "assign(s=undefined_function())", XentGameError, id="undefined-function"
+    ),
+    pytest.param("assign(s=random_func('arg'))", XentGameError, id="undefined-func"),
+    # Functions called with the wrong number of arguments
+    pytest.param("assign(s=xent())", XentGameError, id="xent-no-args"),
+    pytest.param("assign(s=get_story('arg'))", XentGameError, id="get-story-args"),
+    pytest.param(
+        "assign(s=first_n_tokens('string'))", XentGameError, id="first-n-tokens-arity"
+    ),
+    pytest.param(
+        "assign(s=last_n_tokens('string'))", XentGameError, id="last-n-tokens-arity"
+    ),
+]
 
-    @pytest.mark.asyncio
-    async def test_unknown_instruction(self, xrt):
-        """Test that unknown instructions raise exceptions."""
-        with pytest.raises(XentSyntaxError):
-            await eval_line("unknown_instruction(x='test')", 1, xrt)
 
-        with pytest.raises(XentSyntaxError):
-            await eval_line("this_does_not_exist()", 1, xrt)
-
-    @pytest.mark.asyncio
-    async def test_malformed_syntax(self, xrt):
-        """Test various malformed syntax errors."""
-        # Missing closing parenthesis
-        with pytest.raises(XentSyntaxError):
-            await eval_line("assign(s='test'", 1, xrt)
-
-        # Missing quotes
-        with pytest.raises(XentGameError):
-            await eval_line("assign(s=test)", 1, xrt)
-
-        # Invalid Python syntax
-        with pytest.raises(XentSyntaxError):
-            await eval_line("assign s='test'", 1, xrt)
+class TestErrorCases:
+    """Test error handling and invalid usage scenarios."""
 
     @pytest.mark.asyncio
     async def test_empty_instruction(self, xrt):
@@ -935,92 +958,12 @@ class TestErrorCases:
         result = await eval_line("# This is a comment", 1, xrt)
         assert result is None
 
+    @pytest.mark.parametrize("line,error", ERROR_CASES)
     @pytest.mark.asyncio
-    async def test_instruction_argument_errors_comprehensive(self, xrt):
-        """Comprehensive test for wrong types, missing args, and too many args."""
-        # Part 1: Test wrong argument types
-        # assign with positional args
-        with pytest.raises(XentSyntaxError):
-            await eval_line("assign('s', 'value')", 1, xrt)
-
-        # reveal with keyword args
-        with pytest.raises(XentSyntaxError):
-            await eval_line("reveal(value='test')", 1, xrt)
-
-        # ensure with keyword args
-        with pytest.raises(XentSyntaxError):
-            await eval_line("ensure(condition=True)", 1, xrt)
-
-        # Part 2: Test missing required arguments
-        # elicit without token limit
-        with pytest.raises(XentSyntaxError):
-            await eval_line("elicit(s)", 1, xrt)
-
-        # beacon without flag
-        with pytest.raises(XentSyntaxError):
-            await eval_line("beacon()", 1, xrt)
-
-        # replay without arguments
-        with pytest.raises(XentSyntaxError):
-            await eval_line("replay()", 1, xrt)
-
-        # Part 3: Test too many arguments
-        # beacon with multiple flags
-        with pytest.raises(XentSyntaxError):
-            await eval_line("beacon(flag_1, flag_2)", 1, xrt)
-
-    @pytest.mark.asyncio
-    async def test_register_errors_comprehensive(self, xrt):
-        """Comprehensive test for invalid register names and undefined access."""
-        # Part 1: Test invalid register names
-        # Invalid register type
-        with pytest.raises(XentSyntaxError):
-            await eval_line("assign(z='invalid')", 1, xrt)
-
-        # Register number too high
-        with pytest.raises(XentSyntaxError):
-            await eval_line("assign(s99='too_high')", 1, xrt)
-
-        # Invalid format
-        with pytest.raises(XentSyntaxError):
-            await eval_line("assign(1s='invalid')", 1, xrt)
-
-        # Part 2: Test undefined register access
-        # Accessing undefined register in expression
-        with pytest.raises(XentGameError):
-            await eval_line("assign(s=undefined_var)", 1, xrt)
-
-        # Using undefined register in reveal
-        with pytest.raises(XentGameError):
-            await eval_line("reveal(undefined_var)", 1, xrt)
-
-    @pytest.mark.asyncio
-    async def test_undefined_functions(self, xrt):
-        """Test calling undefined functions."""
-        with pytest.raises(XentGameError):
-            await eval_line("assign(s=undefined_function())", 1, xrt)
-
-        with pytest.raises(XentGameError):
-            await eval_line("assign(s=random_func('arg'))", 1, xrt)
-
-    @pytest.mark.asyncio
-    async def test_wrong_function_args(self, xrt):
-        """Test functions with wrong number of arguments."""
-        # xent with no args
-        with pytest.raises(XentGameError):
-            await eval_line("assign(s=xent())", 1, xrt)
-
-        # get_story with args (should take none)
-        with pytest.raises(XentGameError):
-            await eval_line("assign(s=get_story('arg'))", 1, xrt)
-
-        # first_n_tokens with wrong number of args
-        with pytest.raises(XentGameError):
-            await eval_line("assign(s=first_n_tokens('string'))", 1, xrt)
-
-        # last_n_tokens with wrong number of args
-        with pytest.raises(XentGameError):
-            await eval_line("assign(s=last_n_tokens('string'))", 1, xrt)
+    async def test_invalid_line_raises(self, xrt, line, error):
+        """Test that invalid lines raise the expected error."""
+        with pytest.raises(error):
+            await eval_line(line, 1, xrt)
 
 
 class TestCombinedOperations:
@@ -1047,13 +990,12 @@ class TestCombinedOperations:
     @pytest.mark.asyncio
     async def test_elicit_registers(self, xrt):
         """Test basic elicit operation with default player."""
-        await eval_line("assign(s1='test1')", 1, xrt)
-        await eval_line("assign(s2='test2')", 1, xrt)
-        await eval_line("assign(s3='test3')", 1, xrt)
-        await eval_line("assign(t1='test4')", 1, xrt)
-        await eval_line("assign(t2='test5')", 1, xrt)
-        await eval_line("assign(t3='test6')", 1, xrt)
-        await eval_line("elicit(s, 10)", 1, xrt)
+        await eval_line(
+            "assign(s1='test1', s2='test2', s3='test3', t1='test4', t2='test5', t3='test6')",
+            1,
+            xrt,
+        )
+        await eval_line("elicit(s, 10)", 2, xrt)
 
         player = xrt.player
         assert player.event_history[-1]["type"] == "elicit_response"
@@ -1111,9 +1053,7 @@ class TestListDSL:
     @pytest.mark.asyncio
     async def test_elicit_request_includes_list_for_omniscient_player(self, xrt):
         await eval_line("elicit(s, 5)", 1, xrt)
-        event = next(
-            e for e in xrt.player.event_history if e["type"] == "elicit_request"
-        )
+        event = xrt.player.last_event("elicit_request")
         regs = event["registers"]
         assert "l" in regs and isinstance(regs["l"], XList)
 
@@ -1124,9 +1064,7 @@ class TestListDSL:
         # alice is non-omniscient; snapshot should exclude non-public 'l'
         await eval_line("elicit(alice, s, 5)", 1, xrt)
         alice_player = xrt.local_vars["alice"]
-        event = next(
-            e for e in alice_player.event_history if e["type"] == "elicit_request"
-        )
+        event = alice_player.last_event("elicit_request")
         regs = event["registers"]
         assert "l" not in regs
         # Public registers include 'a', 'b', 'p'
@@ -1137,7 +1075,7 @@ class TestListDSL:
     @pytest.mark.asyncio
     async def test_reveal_allows_list_values(self, xrt):
         await eval_line("reveal(l)", 1, xrt)
-        event = next(e for e in xrt.player.event_history if e["type"] == "reveal")
+        event = xrt.player.last_event("reveal")
         assert "l" in event["values"] and isinstance(event["values"]["l"], XList)
 
     @pytest.mark.asyncio
@@ -1145,7 +1083,7 @@ class TestListDSL:
         await eval_line("assign(s='hi')", 1, xrt)
         await eval_line("assign(l=['hello', 'world'])", 1, xrt)
         await eval_line("reveal(s, l)", 2, xrt)
-        event = next(e for e in xrt.player.event_history if e["type"] == "reveal")
+        event = xrt.player.last_event("reveal")
         assert isinstance(event["values"]["s"], XString)
         assert isinstance(event["values"]["l"], XList)
 
@@ -1166,9 +1104,7 @@ class TestListDSL:
     @pytest.mark.asyncio
     async def test_event_serialization_handles_xlist(self, xrt):
         await eval_line("elicit(s, 5)", 1, xrt)
-        event = next(
-            e for e in xrt.player.event_history if e["type"] == "elicit_request"
-        )
+        event = xrt.player.last_event("elicit_request")
         payload = dumps({"type": "xent_event", "event": event})
         # Should serialize list registers as JSON arrays of strings
         parsed = loads(payload)
@@ -1,13 +1,16 @@
 import pytest
 
+from tests._prompts import BOOK_CLUB, COW_PHYSICS
 from xent.benchmark.run_haltable import resume_haltable_game, start_haltable_game
 from xent.common.configuration_types import ExecutableGameMap
 from xent.presentation.executor import get_default_presentation
 
+_DEFAULT_PRESENTATION = get_default_presentation()
+
 
 def _make_halting_egm() -> ExecutableGameMap:
     code = (
-        'assign(s1="At the book club, I ran into this girl, Neila, who claims to only read books backwards: starting from the bottom-right corner of the last page and reading all the words in reverse order until the beginning, finishing with the title. Doesn\'t it spoil the fun of the story? Apparently not, she told me. The suspense is just distributed somewhat differently (some books\' beginnings are apparently all too predictable), and some books get better or worse if you read them in one direction or another. She started reading backwards at age seven. Her name was sort of a predisposition.", s2="Hello, it is today a lovely day to use my skills in differential geometry and in the calculus of variation to estimate how much grass I will be able to eat. I aim to produce a lot of milk and to write a lot of theorems for my children, because that\'s what the beauty of life is about, dear physicists and cheese-makers. Have a great day!")\n'
+        f'assign(s1="{BOOK_CLUB}", s2="{COW_PHYSICS}")\n'
         "reveal(s1, s2)\n"
         "elicit(x, 20)\n"
         "reward(xent(x | s1))\n"
@@ -19,7 +22,7 @@ def _make_halting_egm() -> ExecutableGameMap:
             "name": "test_single_halting",
             "code": code,
             "map_seed": "halt_seed",
-            "presentation_function": get_default_presentation(),
+            "presentation_function": _DEFAULT_PRESENTATION,
         },
         "metadata": {
             "benchmark_id": "halt_bench",
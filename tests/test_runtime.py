@@ -1,5 +1,7 @@
 # pyright: reportUnusedExpression=false
 
+import copy
+
 import pytest
 
 from xent.benchmark.run_benchmark import extract_token_usage
@@ -18,6 +20,7 @@ from xent.common.xent_event import (
     FailedEnsureEvent,
     RevealEvent,
     RewardEvent,
+    TokenUsage,
     XentEvent,
 )
 from xent.presentation.executor import (
@@ -198,42 +201,25 @@ class TestXString:
             "four",
         ]
 
-    def test_operator_cut_front(self):
+    @pytest.mark.parametrize(
+        "left, right, expected",
+        [
+            ("HelloWorldAgain", "World", "Hello"),
+            ("HelloWorldAgain", "Hello", ""),
+            ("HelloWorldAgain", "XYZ", "HelloWorldAgain"),
+            ("HelloWorldAgain", "", "HelloWorldAgain"),
+            ("abcabc", "b", "a"),
+            ("HelloWorldAgain", "Again", "HelloWorld"),
+        ],
+    )
+    def test_operator_cut_front(self, left, right, expected):
         """Tests the '//' operator."""
-        s_main = XString("HelloWorldAgain")
-        s_world = XString("World")
-        s_hello = XString("Hello")
-        s_again = XString("Again")
-        s_notfound = XString("XYZ")
-        s_empty = XString("")
-        s_double = XString("abcabc")
-        s_b = XString("b")
-
-        res1 = s_main // s_world
-        assert isinstance(res1, XString)
-        assert res1.primary_string == "Hello"
-
-        res2 = s_main // s_hello
-        assert isinstance(res2, XString)
-        assert res2.primary_string == ""
-
-        res3 = s_main // s_notfound
-        assert isinstance(res3, XString)
-        assert res3.primary_string == "HelloWorldAgain"
-
-        res4 = s_main // s_empty
-        assert isinstance(res4, XString)
-        assert res4.primary_string == "HelloWorldAgain"
-
-        res5 = s_double // s_b
-        assert isinstance(res5, XString)
-        assert res5.primary_string == "a"
-
-        res6 = s_main // s_again
-        assert isinstance(res6, XString)
-        assert res6.primary_string == "HelloWorld"
+        result = XString(left) // XString(right)
+        assert isinstance(result, XString)
+        assert result.primary_string == expected
 
-        # Test with raw strings
+    def test_operator_cut_front_mixed_operands(self):
+        """Tests '//' between XString and raw str or invalid operands."""
         xs = XString("hello world")
 
         result = xs // "world"
@@ -250,41 +236,25 @@ class TestXString:
         with pytest.raises(XentTypeError):
             123 // xs
 
-    def test_operator_cut_back(self):
-        s_main = XString("HelloWorldAgain")
-        s_world = XString("World")
-        s_hello = XString("Hello")
-        s_again = XString("Again")
-        s_notfound = XString("XYZ")
-        s_empty = XString("")
-        s_double = XString("abcabc")
-        s_b = XString("b")
-
-        res1 = s_main % s_hello
-        assert isinstance(res1, XString)
-        assert res1.primary_string == "WorldAgain"
-
-        res2 = s_main % s_again
-        assert isinstance(res2, XString)
-        assert res2.primary_string == ""
-
-        res3 = s_main % s_notfound
-        assert isinstance(res3, XString)
-        assert res3.primary_string == ""
-
-        res4 = s_main % s_empty
-        assert isinstance(res4, XString)
-        assert res4.primary_string == ""
-
-        res5 = s_double % s_b
-        assert isinstance(res5, XString)
-        assert res5.primary_string == "cabc"
-
-        res6 = s_main % s_world
-        assert isinstance(res6, XString)
-        assert res6.primary_string == "Again"
+    @pytest.mark.parametrize(
+        "left, right, expected",
+        [
+            ("HelloWorldAgain", "Hello", "WorldAgain"),
+            ("HelloWorldAgain", "Again", ""),
+            ("HelloWorldAgain", "XYZ", ""),
+            ("HelloWorldAgain", "", ""),
+            ("abcabc", "b", "cabc"),
+            ("HelloWorldAgain", "World", "Again"),
+        ],
+    )
+    def test_operator_cut_back(self, left, right, expected):
+        """Tests the '%' operator."""
+        result = XString(left) % XString(right)
+        assert isinstance(result, XString)
+        assert result.primary_string == expected
 
-        # Test with raw strings
+    def test_operator_cut_back_mixed_operands(self):
+        """Tests '%' between XString and raw str or invalid operands."""
         xs = XString("hello world")
 
         result = xs % "hello"
@@ -728,14 +698,15 @@ class TestTokenXentList:
         assert abs(result.total_xent() - expected) < 0.01
 
 
+# Keeps the Qwen judge on one xdist worker, so it is loaded once per run
+@pytest.mark.xdist_group("qwen_judge")
 class TestJudge:
     """Tests for Judge class functionality."""
 
     @pytest.fixture
-    def judge(self):
+    def judge(self, judge_for):
         """Create a test Judge instance."""
-        judge = Judge("Qwen/Qwen3-0.6B-Base")
-        return judge
+        return judge_for("Qwen/Qwen3-0.6B-Base")
 
     def _find_single_token_string(self, judge: Judge) -> str:
         probe = "Tokenizer probe: hello world."
@@ -807,6 +778,25 @@ class TestJudge:
         assert len(judge.xed(prefixed, include_first_token=True).pairs) == num_tokens
         assert len(judge.dex(prefixed, include_first_token=True).pairs) == num_tokens
 
+    @pytest.mark.parametrize("include_first_token", [False, True])
+    def test_xent_batch_matches_xent(self, judge, include_first_token):
+        strings = [
+            XString("Hello world"),
+            XString(""),
+            XString("A much longer string to force some padding") | "Prefix: ",
+        ]
+        preprompts = ["", "ignored", "Context. "]
+
+        batched = judge.xent_batch(strings, preprompts, include_first_token)
+
+        assert len(batched) == len(strings)
+        for string, preprompt, txl in zip(strings, preprompts, batched, strict=True):
+            expected = judge.xent(string, preprompt, include_first_token)
+            assert [token for token, _ in txl.pairs] == [
+                token for token, _ in expected.pairs
+            ]
+            assert txl.total_xent() == pytest.approx(expected.total_xent(), abs=1e-3)
+
 
 class TestTokenUsage:
     """Tests for token usage tracking functionality."""
@@ -834,21 +824,30 @@ class TestTokenUsage:
         },
     }
 
+    @pytest.fixture
+    def make_xrt(self, gpt2_judge):
+        """Return a factory for runtimes whose mock player reports fixed token usage."""
+
+        def _make_xrt(token_usage_per_move: TokenUsage) -> XentRuntime:
+            # Treat FAKE_GAME_CONFIG as immutable; deepcopy it in any test that mutates
+            game_config = self.FAKE_GAME_CONFIG
+            player = MockXGP(
+                "black",
+                "test_black",
+                {},
+                game_config,
+                token_usage_per_move=token_usage_per_move,
+            )
+            locals = build_locals(player, [], game_config)
+            globals = build_globals(gpt2_judge)
+            return XentRuntime(player, [], locals, globals)
+
+        return _make_xrt
+
     @pytest.mark.asyncio
-    async def test_game_iteration_reset(self):
+    async def test_game_iteration_reset(self, make_xrt):
         """Test that token usage resets between iterations but accumulates in final results."""
-        game_config = self.FAKE_GAME_CONFIG.copy()
-        player = MockXGP(
-            "black",
-            "test_black",
-            {},
-            game_config,
-            token_usage_per_move={"input_tokens": 15, "output_tokens": 10},
-        )
-        locals = build_locals(player, [], game_config)
-        judge = Judge("gpt2")
-        globals = build_globals(judge)
-        xrt = XentRuntime(player, [], locals, globals)
+        xrt = make_xrt({"input_tokens": 15, "output_tokens": 10})
 
         # First iteration: make some moves
         await eval_line("elicit(s1, 20)", 1, xrt)
@@ -888,20 +887,9 @@ class TestTokenUsage:
         assert total_usage["output_tokens"] == 30  # 20 + 10
 
     @pytest.mark.asyncio
-    async def test_zero_token_usage(self):
+    async def test_zero_token_usage(self, make_xrt):
         """Test handling of zero token usage scenarios."""
-        game_config = self.FAKE_GAME_CONFIG.copy()
-        player = MockXGP(
-            "black",
-            "test_black",
-            {},
-            game_config,
-            token_usage_per_move={"input_tokens": 0, "output_tokens": 0},
-        )
-        locals = build_locals(player, [], game_config)
-        judge = Judge("gpt2")
-        globals = build_globals(judge)
-        xrt = XentRuntime(player, [], locals, globals)
+        xrt = make_xrt({"input_tokens": 0, "output_tokens": 0})
 
         # Make elicit call with zero token usage
         await eval_line("elicit(s1, 20)", 1, xrt)
@@ -1092,6 +1080,24 @@ def present_turn(state, since_events, metadata, full_history=None, ctx=None):
         result = "\n".join(m["content"] for m in messages)
         assert result == "Simple presentation"
 
+    def test_instances_share_code_but_not_namespace(self):
+        code = """
+calls = []
+
+def present_turn(state, since_events, metadata, full_history=None, ctx=None):
+    calls.append(1)
+    return [dict(role="user", content=str(len(calls)))]
+"""
+        first = PresentationFunction(code)
+        second = PresentationFunction(code)
+        assert first.compiled_code is second.compiled_code
+
+        first({}, [], SAMPLE_METADATA)
+        messages, _ = first({}, [], SAMPLE_METADATA)
+        assert messages[0]["content"] == "2"
+        messages, _ = second({}, [], SAMPLE_METADATA)
+        assert messages[0]["content"] == "1"
+
     def test_presentation_with_sdk_functions(self):
         code = """
 from xent.presentation.sdk import format_elicit_request, format_reveal, ChatBuilder
@@ -1240,7 +1246,7 @@ def present_turn(state, since_events, metadata, full_history=None, ctx=None):
         assert "Score: 35" in result  # rounded by round_xent
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def game_config():
     """Create a game config with a custom presentation function"""
     presentation_code = """
@@ -1351,13 +1357,15 @@ class TestPresentationIntegration:
 def present_turn(state, since_events, metadata, full_history=None, ctx=None):
     raise ValueError("Intentional error")
 """
-        game_config["game_map"]["presentation_function"] = broken_code
+        # game_config is shared across the module, so change a copy
+        broken_config = copy.deepcopy(game_config)
+        broken_config["game_map"]["presentation_function"] = broken_code
 
         options: dict[str, str | int | float | bool] = {
             "provider": "ollama",
             "model": "test",
         }
-        player = DefaultXGP("black", "test_id", options, game_config)
+        player = DefaultXGP("black", "test_id", options, broken_config)
 
         assert player.presentation_function is not None
 
@@ -1,3 +1,5 @@
+import itertools
+from collections.abc import Iterable
 from unittest.mock import Mock
 
 import pytest
@@ -40,25 +42,43 @@ def test_generate_list_smoke():
         assert not lx.startswith("end list")
 
 
+class FakeJudge:
+    """Plain stand-in for Judge that hands out canned story texts."""
+
+    def __init__(self, texts: Iterable[str]):
+        self._texts = iter(texts)
+        self.generate_text_calls = 0
+        self.set_seed_calls = 0
+
+    def generate_text(self) -> str:
+        self.generate_text_calls += 1
+        return next(self._texts)
+
+    def set_seed(self, *args) -> None:
+        self.set_seed_calls += 1
+
+
 class TestExpandConfig:
     """Tests for expand_game_config and related functionality."""
 
     @pytest.fixture
     def mock_judge(self):
         """Create a mock Judge that returns predictable story content"""
-        judge = Mock()
-        # Use side_effect to return different values on subsequent calls
-        judge.generate_text.side_effect = [
-            "Once upon a time in a distant galaxy...",
-            "The mysterious stranger arrived at midnight...",
-            "In the depths of the ancient forest...",
-            "A brilliant scientist made a discovery...",
-            "The dragon soared above the clouds...",
-        ]
-        judge.set_seed = Mock()
-        return judge
+        # Returns a different story on each subsequent call, wrapping around after
+        # the fifth so games with many story() calls don't run out
+        return FakeJudge(
+            itertools.cycle(
+                (
+                    "Once upon a time in a distant galaxy...",
+                    "The mysterious stranger arrived at midnight...",
+                    "In the depths of the ancient forest...",
+                    "A brilliant scientist made a discovery...",
+                    "The dragon soared above the clouds...",
+                )
+            )
+        )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def simple_game_config(self):
         """Create a simple game config with a single story() call"""
         return GameConfig(
@@ -72,7 +92,7 @@ class TestExpandConfig:
             presentation_function="",
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def multi_story_game_config(self):
         """Create a game config with multiple story() calls"""
         return GameConfig(
@@ -88,7 +108,7 @@ class TestExpandConfig:
             presentation_function="",
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def no_story_game_config(self):
         """Create a game config without any story() calls"""
         return GameConfig(
@@ -102,7 +122,7 @@ class TestExpandConfig:
             presentation_function="",
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def complex_story_game_config(self):
         """Create a game config with story() in complex expressions"""
         return GameConfig(
@@ -140,8 +160,8 @@ class TestExpandConfig:
         assert "reward(xent(x | s))" in expanded["code"]
 
         # Verify judge methods were called
-        mock_judge.set_seed.assert_not_called()
-        mock_judge.generate_text.assert_called_once()
+        assert mock_judge.set_seed_calls == 0
+        assert mock_judge.generate_text_calls == 1
 
     def test_expand_game_config_multiple_stories(
         self, multi_story_game_config, mock_judge
@@ -160,7 +180,7 @@ class TestExpandConfig:
         assert "In the depths of the ancient forest..." in expanded["code"]
 
         # Should have generated 3 stories
-        assert mock_judge.generate_text.call_count == 3
+        assert mock_judge.generate_text_calls == 3
 
     def test_expand_game_config_no_story(self, no_story_game_config):
         """Test expansion of game with no story() calls"""
@@ -176,8 +196,7 @@ class TestExpandConfig:
 
     def test_complex_story_composition(self, complex_story_game_config):
         """Test that complex expressions with story() are handled correctly"""
-        mock_judge = Mock()
-        mock_judge.generate_text.return_value = "Generated story content"
+        mock_judge = FakeJudge(itertools.repeat("Generated story content"))
 
         expanded = expand_game_config(complex_story_game_config, "seed", mock_judge)
         code = expanded["code"]
@@ -189,8 +208,7 @@ class TestExpandConfig:
 
     def test_preprocess_dsl_code(self):
         """Direct tests of preprocess_dsl_code behavior"""
-        mock_judge = Mock()
-        mock_judge.generate_text.return_value = "Test story"
+        mock_judge = FakeJudge(itertools.repeat("Test story"))
 
         code = "assign(x=story())\nreveal(x)\nelicit(10)"
         result = preprocess_dsl_code(code, mock_judge)
@@ -211,8 +229,7 @@ class TestExpandConfig:
 
     def test_story_rewriter_only_replaces_story_function(self):
         """Test that StoryRewriter only replaces story() calls, not other functions"""
-        mock_judge = Mock()
-        mock_judge.generate_text.return_value = "Test story"
+        mock_judge = FakeJudge(itertools.repeat("Test story"))
 
         code_with_other_functions = """
             assign(a=story(), b=other_function(), c=yet_another())